@@ -29,7 +29,6 @@ import json
 import multiprocessing
 import operator
 import os
-import pickle
 import sys
 import time
 import traceback
@@ -50,6 +49,7 @@ from aibolit.ast_framework.java_class_decomposition import decompose_java_class
 from aibolit.config import Config
 from aibolit.ml_pipeline.ml_pipeline import train_process, collect_dataset
 from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.model_io import load_model
 from javalang.parser import JavaSyntaxError
 from aibolit.metrics.ncss.ncss import NCSSMetric
 from aibolit.ast_framework import AST, ASTNodeType
@@ -142,20 +142,19 @@ def train():
     train_process(metric_name_to_code[args.target_metric])
 
 
-def __count_value(value_dict, input_params, code_lines_dict, java_file: str, is_metric=False):
+def __count_value(value_dict, input_params, code_lines_dict, ast: AST, is_metric=False):
     """
     Count value for input dict
 
     :param value_dict: Pattern item or Metric item from CONFIG
     :param input_params: list with calculated patterns/metrics
     :param code_lines_dict: list with found code lines of patterns/metrics
-    :param java_file: full path for java file
+    :param ast: AST of java file
     :is_metric: is item metric?
     :return: None, it has side-effect
     """
     acronym = value_dict['code']
     try:
-        ast = AST.build_from_javalang(build_ast(java_file))
         val = value_dict['make']().value(ast)
         if not is_metric:
             input_params[acronym] = len(val)
@@ -274,7 +273,7 @@ def find_start_and_end_lines(node) -> Tuple[int, int]:  # noqa: C901
 
 
 def calculate_patterns_and_metrics_with_decomposition(
-        file_path: str,
+        ast: AST,
         args):
     error_exc = None
     patterns_to_suppress = args.suppress
@@ -293,7 +292,6 @@ def calculate_patterns_and_metrics_with_decomposition(
             for metric_info in config["metrics"]
             if metric_info["code"] not in config["metrics_exclude"]
         ]
-        ast = AST.build_from_javalang(build_ast(file_path))
         classes_ast = [
             ast.get_subtree(node)
             for node in ast.get_root().types
@@ -338,18 +336,19 @@ def calculate_patterns_and_metrics(file, args):
     patterns_to_suppress = args.suppress
     try:
         config = Config.get_patterns_config()
+        ast = AST.build_from_javalang(build_ast(file))
         for pattern in config['patterns']:
             if pattern['code'] in config['patterns_exclude']:
                 continue
             if pattern['code'] in patterns_to_suppress:
                 input_params[pattern['code']] = 0
             else:
-                __count_value(pattern, input_params, code_lines_dict, file)
+                __count_value(pattern, input_params, code_lines_dict, ast)
 
         for metric in config['metrics']:
             if metric['code'] in config['metrics_exclude']:
                 continue
-            __count_value(metric, input_params, code_lines_dict, file, is_metric=True)
+            __count_value(metric, input_params, code_lines_dict, ast, is_metric=True)
     except Exception as ex:
         error_exc = ex
         input_params = []  # type: ignore
@@ -376,8 +375,7 @@ def inference(
     if input_params:
         if not model_path:
             model_path = Config.folder_model_data()
-        with open(model_path, 'rb') as fid:
-            model = pickle.load(fid)
+        model = load_model(model_path)
         sorted_result, importances = model.predict(input_params)
         patterns_list = model.features_conf['features_order']
         for iter, (key, val) in enumerate(sorted_result.items()):
@@ -434,7 +432,6 @@ def run_recommend_for_file(file: str, args):  # flake8: noqa
     :param args: different command line arguments
     :return: dict with code lines, filename and pattern name
     """
-    java_file = str(Path(os.getcwd(), file))
     ncss = 0
     try:
         tree = build_ast(file)
@@ -454,7 +451,8 @@ def run_recommend_for_file(file: str, args):  # flake8: noqa
             for p in patterns_list:
                 patterns_ignored[p].append([node.position.line, node.position.line])
 
-        components, error_exception = calculate_patterns_and_metrics_with_decomposition(java_file, args)
+        ast = AST.build_from_javalang(tree)
+        components, error_exception = calculate_patterns_and_metrics_with_decomposition(ast, args)
 
         if not components:
             results_list = []  # type: ignore
@@ -476,7 +474,7 @@ def run_recommend_for_file(file: str, args):  # flake8: noqa
                 if ranked_results:
                     results_list.append(ranked_results)
 
-        ncss = NCSSMetric().value(AST.build_from_javalang(build_ast(file)))
+        ncss = NCSSMetric().value(ast)
     except Exception as e:
         error_exception = e
         ncss = 0
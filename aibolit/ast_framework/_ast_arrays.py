@@ -0,0 +1,213 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2020 Aibolit
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np  # type: ignore
+from networkx import DiGraph  # type: ignore
+
+from aibolit.ast_framework.ast_node_type import ASTNodeType
+
+_NO_POSITIONS = np.empty(0, dtype=np.int32)
+
+
+class ASTArrays:
+    '''
+    Structure of arrays representation of AST graph structure.
+    Nodes are addressed by their positions, which follow the order of graph nodes:
+     - node_indexes[position] is an index of the node in networkx graph
+     - types[position] is a value of the node ASTNodeType
+     - parents[position] is a position of the parent node, -1 for nodes without parent
+     - children of the node are stored in CSR format, i.e. their positions are
+       children_positions[children_offsets[position]:children_offsets[position + 1]]
+    Additionally all nodes are lazily ordered in depth first preorder, starting from nodes without parent.
+    In that order every subtree occupies a contiguous range, so it is selected by a slice:
+     - preorder[rank] is a position of the node with given rank
+     - subtree of the node with given rank is preorder[rank:subtree_ends[rank]]
+     - ranks[position] is a rank of the node at given position
+    Positions of nodes of every type are lazily grouped too, so nodes of the whole tree
+    with given types are found without scanning all of them on every query.
+    '''
+
+    def __init__(self, node_indexes: np.ndarray, types: np.ndarray, parents: np.ndarray,
+                 children_offsets: np.ndarray, children_positions: np.ndarray):
+        self.node_indexes = node_indexes
+        self.types = types
+        self.parents = parents
+        self.children_offsets = children_offsets
+        self.children_positions = children_positions
+
+        # plain lists are much faster than numpy arrays for element-wise access from python code
+        self.node_indexes_list: List[int] = node_indexes.tolist()
+        self.types_list: List[int] = types.tolist()
+        self._children_offsets: List[int] = children_offsets.tolist()
+        self._children_positions: List[int] = children_positions.tolist()
+
+        self.position_by_index: Dict[int, int] = {
+            node_index: position for position, node_index in enumerate(self.node_indexes_list)
+        }
+
+        self._preorder: Optional[np.ndarray] = None
+        self._subtree_ends: Optional[np.ndarray] = None
+        self._ranks: Optional[np.ndarray] = None
+        self._positions_by_type: Optional[Dict[int, np.ndarray]] = None
+
+        # lazily filled cache of children indexes grouped by node type value
+        self._children_by_type: Dict[int, Dict[int, List[int]]] = {}
+
+    @staticmethod
+    def from_networkx(tree: DiGraph) -> 'ASTArrays':
+        nodes_count = len(tree)
+        node_indexes = np.fromiter(tree.nodes, dtype=np.int32, count=nodes_count)
+        types = np.fromiter(
+            (attributes.get('node_type', ASTNodeType.UNKNOWN) for attributes in tree.nodes.values()),
+            dtype=np.int8, count=nodes_count
+        )
+
+        position_by_index = {node_index: position for position, node_index in enumerate(tree.nodes)}
+        children_offsets = np.zeros(nodes_count + 1, dtype=np.int32)
+        children_positions_list: List[int] = []
+        for position, node_index in enumerate(tree.nodes):
+            children_positions_list.extend(position_by_index[child] for child in tree.succ[node_index])
+            children_offsets[position + 1] = len(children_positions_list)
+        children_positions = np.array(children_positions_list, dtype=np.int32)
+
+        parents = np.full(nodes_count, -1, dtype=np.int32)
+        parents[children_positions] = np.repeat(np.arange(nodes_count, dtype=np.int32),
+                                                np.diff(children_offsets))
+
+        return ASTArrays(node_indexes, types, parents, children_offsets, children_positions)
+
+    def is_tree_root(self, node_index: int) -> bool:
+        return self.parents[self.position_by_index[node_index]] == -1
+
+    def children(self, position: int) -> List[int]:
+        return self._children_positions[self._children_offsets[position]:self._children_offsets[position + 1]]
+
+    def preorder(self, position: int) -> Iterator[Tuple[int, int]]:
+        '''
+        Yields pairs of position and depth for all nodes of the subtree
+        with given root in depth first preorder.
+        '''
+        children_offsets = self._children_offsets
+        children_positions = self._children_positions
+        stack = [(position, 0)]
+        while stack:
+            position, depth = stack.pop()
+            yield position, depth
+            children = children_positions[children_offsets[position]:children_offsets[position + 1]]
+            stack.extend((child, depth + 1) for child in reversed(children))
+
+    def subtree_positions(self, position: int) -> np.ndarray:
+        preorder, subtree_ends, ranks = self._preorder_ranges()
+        rank = ranks[position]
+        return preorder[rank:subtree_ends[rank]]
+
+    def subtree_node_indexes(self, node_index: int) -> List[int]:
+        return self.node_indexes[self.subtree_positions(self.position_by_index[node_index])].tolist()
+
+    def outermost_subtrees_with_types(self, position: int, *types: ASTNodeType) -> Iterator[np.ndarray]:
+        '''
+        Yields arrays of positions of subtrees, which roots have one of given types,
+        taken from the subtree of the node at given position.
+        Subtrees nested into other yielded subtrees are skipped.
+        '''
+        preorder, subtree_ends, ranks = self._preorder_ranges()
+        first_rank = ranks[position]
+        last_rank = subtree_ends[first_rank]
+        roots_ranks = first_rank + np.flatnonzero(np.isin(self.types[preorder[first_rank:last_rank]], types))
+        roots_ends = subtree_ends[roots_ranks]
+        # a subtree is nested, if it starts before any of previous subtrees ends
+        previous_ends = np.maximum.accumulate(roots_ends)[:-1]
+        is_outermost = np.ones(len(roots_ranks), dtype=bool)
+        is_outermost[1:] = roots_ranks[1:] >= previous_ends
+        for rank, end in zip(roots_ranks[is_outermost].tolist(), roots_ends[is_outermost].tolist()):
+            yield preorder[rank:end]
+
+    def children_with_type(self, node_index: int, child_type: ASTNodeType) -> List[int]:
+        '''
+        Returns indexes of children of the node with given type.
+        Resulted list is shared between calls and must not be modified.
+        '''
+        children_by_type = self._children_by_type.get(node_index)
+        if children_by_type is None:
+            position = self.position_by_index[node_index]
+            children_by_type = self._group_by_type(self.children(position))
+            self._children_by_type[node_index] = children_by_type
+        return children_by_type.get(child_type, [])
+
+    def descendants_with_type(self, node_index: int, descendant_type: ASTNodeType) -> List[int]:
+        '''
+        Returns sorted indexes of all nodes with given type, which are reachable from the node.
+        '''
+        descendants = self.subtree_positions(self.position_by_index[node_index])[1:]
+        descendants_with_type = descendants[self.types[descendants] == descendant_type]
+        return np.sort(self.node_indexes[descendants_with_type]).tolist()
+
+    def nodes_with_types(self, *types: ASTNodeType) -> List[int]:
+        positions_by_type = self._group_positions_by_type()
+        if len(types) == 1:
+            positions = positions_by_type.get(types[0], _NO_POSITIONS)
+        else:
+            positions = np.sort(np.concatenate(
+                [positions_by_type.get(node_type, _NO_POSITIONS) for node_type in set(types)]
+            ))
+        return self.node_indexes[positions].tolist()
+
+    def _preorder_ranges(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self._preorder is None or self._subtree_ends is None or self._ranks is None:
+            nodes_count = len(self.types_list)
+            preorder: List[int] = []
+            subtree_ends = [0] * nodes_count
+            for root in np.flatnonzero(self.parents == -1).tolist():
+                # ranks and depths of nodes, which subtrees are not finished yet
+                open_subtrees: List[Tuple[int, int]] = []
+                for position, depth in self.preorder(root):
+                    rank = len(preorder)
+                    while open_subtrees and open_subtrees[-1][1] >= depth:
+                        subtree_ends[open_subtrees.pop()[0]] = rank
+                    open_subtrees.append((rank, depth))
+                    preorder.append(position)
+                for rank, _ in open_subtrees:
+                    subtree_ends[rank] = len(preorder)
+
+            self._preorder = np.array(preorder, dtype=np.int32)
+            self._subtree_ends = np.array(subtree_ends, dtype=np.int32)
+            self._ranks = np.empty(nodes_count, dtype=np.int32)
+            self._ranks[self._preorder] = np.arange(nodes_count, dtype=np.int32)
+        return self._preorder, self._subtree_ends, self._ranks
+
+    def _group_positions_by_type(self) -> Dict[int, np.ndarray]:
+        if self._positions_by_type is None:
+            # stable sort keeps positions of the nodes with the same type in ascending order
+            positions = np.argsort(self.types, kind='stable').astype(np.int32)
+            node_types, first_occurrences = np.unique(self.types[positions], return_index=True)
+            self._positions_by_type = dict(zip(node_types.tolist(), np.split(positions, first_occurrences[1:])))
+        return self._positions_by_type
+
+    def _group_by_type(self, positions: List[int]) -> Dict[int, List[int]]:
+        node_indexes = self.node_indexes_list
+        types = self.types_list
+        node_indexes_by_type: Dict[int, List[int]] = {}
+        for position in positions:
+            node_indexes_by_type.setdefault(types[position], []).append(node_indexes[position])
+        return node_indexes_by_type
@@ -20,59 +20,85 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from collections import namedtuple
 from itertools import islice, repeat, chain
 
 from deprecated import deprecated  # type: ignore
 from javalang.tree import Node
 from networkx import DiGraph, dfs_labeled_edges, dfs_preorder_nodes  # type: ignore
-from typing import Union, Any, Callable, Set, List, Iterator, Tuple, Dict, cast, Optional
+from typing import Union, Any, Callable, Set, List, Iterable, Iterator, Tuple, Dict, Type, NamedTuple, cast, Optional
 
 from aibolit.ast_framework.ast_node_type import ASTNodeType
 from aibolit.ast_framework._auxiliary_data import javalang_to_ast_node_type, attributes_by_node_type, ASTNodeReference
 from aibolit.ast_framework.ast_node import ASTNode
+from aibolit.ast_framework._ast_arrays import ASTArrays
 
-MethodInvocationParams = namedtuple('MethodInvocationParams', ['object_name', 'method_name'])
 
-MemberReferenceParams = namedtuple('MemberReferenceParams', ('object_name', 'member_name', 'unary_operator'))
+class MethodInvocationParams(NamedTuple):
+    object_name: str
+    method_name: str
+
+
+class MemberReferenceParams(NamedTuple):
+    object_name: str
+    member_name: str
+    unary_operator: str
+
+
+class BinaryOperationParams(NamedTuple):
+    operation: str
+    left_side: int
+    right_side: int
 
-BinaryOperationParams = namedtuple('BinaryOperationParams', ('operation', 'left_side', 'right_side'))
 
 TraverseCallback = Callable[[ASTNode], None]
 
+# plain module level names spare enum attribute lookups in functions called for every node
+_METHOD_DECLARATION = ASTNodeType.METHOD_DECLARATION
+_LAMBDA_EXPRESSION = ASTNodeType.LAMBDA_EXPRESSION
+
 
 class AST:
-    def __init__(self, networkx_tree: DiGraph, root: int):
+    # many ASTs are created for subtrees, so they have no per instance '__dict__'
+    __slots__ = ('tree', 'root', '_arrays')
+
+    def __init__(self, networkx_tree: DiGraph, root: int, arrays: Optional[ASTArrays] = None):
+        '''
+        arrays is an index of the whole tree, which networkx_tree is a complete subtree of.
+        It is built once by build_from_javalang and shared by all subtrees.
+        Without it queries are answered by traversing networkx graph directly.
+        '''
         self.tree = networkx_tree
         self.root = root
+        self._arrays = arrays
 
     @staticmethod
     def build_from_javalang(javalang_ast_root: Node) -> 'AST':
-        tree = DiGraph()
+        nodes: List[Tuple[int, Dict[str, Any]]] = []
+        edges: List[Tuple[int, int]] = []
         javalang_node_to_index_map: Dict[Node, int] = {}
-        root = AST._add_subtree_from_javalang_node(tree, javalang_ast_root,
+        root = AST._add_subtree_from_javalang_node(nodes, edges, javalang_ast_root,
                                                    javalang_node_to_index_map)
+        # graph is filled at once, because networkx has noticeable overhead on each call
+        tree = DiGraph()
+        tree.add_nodes_from(nodes)
+        tree.add_edges_from(edges)
         AST._replace_javalang_nodes_in_attributes(tree, javalang_node_to_index_map)
-        return AST(tree, root)
+        return AST(tree, root, ASTArrays.from_networkx(tree))
 
     def __str__(self) -> str:
         printed_graph = ''
-        depth = 0
-        for _, destination, edge_type in dfs_labeled_edges(self.tree, self.root):
-            if edge_type == 'forward':
-                printed_graph += '|   ' * depth
-                node_type = self.tree.nodes[destination]['node_type']
-                printed_graph += str(node_type) + ': '
-                if node_type == ASTNodeType.STRING:
-                    printed_graph += self.tree.nodes[destination]['string'] + ', '
-                printed_graph += f'node index = {destination}'
-                node_line = self.tree.nodes[destination]['line']
-                if node_line is not None:
-                    printed_graph += f', line = {node_line}'
-                printed_graph += '\n'
-                depth += 1
-            elif edge_type == 'reverse':
-                depth -= 1
+        for node_index, depth in self._preorder_with_depth():
+            node_attributes = self.tree.nodes[node_index]
+            printed_graph += '|   ' * depth
+            node_type = node_attributes['node_type']
+            printed_graph += str(node_type) + ': '
+            if node_type == ASTNodeType.STRING:
+                printed_graph += node_attributes['string'] + ', '
+            printed_graph += f'node index = {node_index}'
+            node_line = node_attributes['line']
+            if node_line is not None:
+                printed_graph += f', line = {node_line}'
+            printed_graph += '\n'
         return printed_graph
 
     def get_root(self) -> ASTNode:
@@ -88,27 +114,23 @@ class AST:
         If such subtrees are one including the other, only the larger one is
         going to be in resulted sequence.
         '''
-        is_inside_subtree = False
-        current_subtree_root = -1  # all node indexes are positive
-        subtree: List[int] = []
-        for _, destination, edge_type in dfs_labeled_edges(self.tree, self.root):
-            if edge_type == 'forward':
-                if is_inside_subtree:
-                    subtree.append(destination)
-                elif self.tree.nodes[destination]['node_type'] in root_type:
-                    subtree.append(destination)
-                    is_inside_subtree = True
-                    current_subtree_root = destination
-            elif edge_type == 'reverse' and destination == current_subtree_root:
-                is_inside_subtree = False
-                yield AST(self.tree.subgraph(subtree), current_subtree_root)
-                subtree = []
-                current_subtree_root = -1
+        arrays = self._arrays
+        if arrays is None:
+            yield from self._get_subtrees_from_networkx(*root_type)
+            return
+
+        root_position = arrays.position_by_index[self.root]
+        for subtree_positions in arrays.outermost_subtrees_with_types(root_position, *root_type):
+            subtree = arrays.node_indexes[subtree_positions].tolist()
+            yield AST(self.tree.subgraph(subtree), subtree[0], arrays)
 
     def get_subtree(self, node: ASTNode) -> 'AST':
-        subtree_nodes_indexes = dfs_preorder_nodes(self.tree, node.node_index)
+        if self._arrays is None:
+            subtree_nodes_indexes: Iterable[int] = dfs_preorder_nodes(self.tree, node.node_index)
+        else:
+            subtree_nodes_indexes = self._arrays.subtree_node_indexes(node.node_index)
         subtree = self.tree.subgraph(subtree_nodes_indexes)
-        return AST(subtree, node.node_index)
+        return AST(subtree, node.node_index, self._arrays)
 
     def traverse(
         self,
@@ -132,18 +154,18 @@ class AST:
         '''
         Yields children of node with given type.
         '''
-        for child in self.tree.succ[node]:
-            if self.tree.nodes[child]['node_type'] == child_type:
-                yield child
+        yield from self._children_with_type(node, child_type)
 
     @deprecated(reason='Use ASTNode functionality instead.')
     def list_all_children_with_type(self, node: int, child_type: ASTNodeType) -> List[int]:
-        list_node: List[int] = []
-        for child in self.tree.succ[node]:
-            list_node = list_node + self.list_all_children_with_type(child, child_type)
-            if self.tree.nodes[child]['node_type'] == child_type:
-                list_node.append(child)
-        return sorted(list_node)
+        if self._arrays is None:
+            list_node: List[int] = []
+            for child in self.tree.succ[node]:
+                list_node = list_node + self.list_all_children_with_type(child, child_type)
+                if self.tree.nodes[child]['node_type'] == child_type:
+                    list_node.append(child)
+            return sorted(list_node)
+        return self._arrays.descendants_with_type(node, child_type)
 
     @deprecated(reason='Use ASTNode functionality instead.')
     def all_children_with_type(self, node: int, child_type: ASTNodeType) -> Iterator[int]:
@@ -154,12 +176,13 @@ class AST:
             yield child
 
     @deprecated(reason='Use ASTNode functionality instead.')
-    def get_first_n_children_with_type(self, node: int, child_type: ASTNodeType, quantity: int) -> List[int]:
+    def get_first_n_children_with_type(self, node: int, child_type: ASTNodeType,
+                                       quantity: int) -> List[Optional[int]]:
         '''
         Returns first quantity of children of node with type child_type.
         Resulted list is padded with None to length quantity.
         '''
-        children_with_type = (child for child in self.tree.succ[node] if self.get_type(child) == child_type)
+        children_with_type = self._children_with_type(node, child_type)
         children_with_type_padded = chain(children_with_type, repeat(None))
         return list(islice(children_with_type_padded, 0, quantity))
 
@@ -179,14 +202,15 @@ class AST:
 
     @deprecated(reason='Use get_proxy_nodes instead.')
     def get_nodes(self, type: Union[ASTNodeType, None] = None) -> Iterator[int]:
-        for node in self.tree.nodes:
-            if type is None or self.tree.nodes[node]['node_type'] == type:
-                yield node
+        if type is None:
+            yield from self.tree.nodes
+        else:
+            yield from self._nodes_with_types(type)
 
     def get_proxy_nodes(self, *types: ASTNodeType) -> Iterator[ASTNode]:
-        for node in self.tree.nodes:
-            if len(types) == 0 or self.tree.nodes[node]['node_type'] in types:
-                yield ASTNode(self.tree, node)
+        nodes = self._nodes_with_types(*types) if types else self.tree.nodes
+        for node in nodes:
+            yield ASTNode(self.tree, node)
 
     @deprecated(reason='Use ASTNode functionality instead.')
     def get_attr(self, node: int, attr_name: str, default_value: Any = None) -> Any:
@@ -234,95 +258,163 @@ class AST:
         operation_node, left_side_node, right_side_node = self.tree.succ[binary_operation_node]
         return BinaryOperationParams(self.get_attr(operation_node, 'string'), left_side_node, right_side_node)
 
-    @staticmethod
-    def _add_subtree_from_javalang_node(tree: DiGraph, javalang_node: Union[Node, Set[Any], str],
-                                        javalang_node_to_index_map: Dict[Node, int]) -> int:
-        node_index, node_type = AST._add_javalang_node(tree, javalang_node)
-        if node_index != AST._UNKNOWN_NODE_TYPE and \
-           node_type not in {ASTNodeType.COLLECTION, ASTNodeType.STRING}:
-            javalang_standard_node = cast(Node, javalang_node)
-            javalang_node_to_index_map[javalang_standard_node] = node_index
-            AST._add_javalang_children(tree, javalang_standard_node.children, node_index,
-                                       javalang_node_to_index_map)
-        return node_index
+    def _nodes_with_types(self, *types: ASTNodeType) -> Iterable[int]:
+        '''
+        Nodes are listed in the order of networkx graph nodes.
+        '''
+        arrays = self._arrays
+        if arrays is None:
+            return (node for node in self.tree.nodes if self.tree.nodes[node]['node_type'] in types)
+
+        if arrays.is_tree_root(self.root):
+            return arrays.nodes_with_types(*types)
+
+        # arrays of a larger tree are used only to look up node types,
+        # because the subtree nodes must keep the order of its graph view
+        node_types = arrays.types_list
+        position_by_index = arrays.position_by_index
+        return (node for node in self.tree.nodes if node_types[position_by_index[node]] in types)
+
+    def _children_with_type(self, node: int, child_type: ASTNodeType) -> Iterable[int]:
+        if self._arrays is None:
+            return (child for child in self.tree.succ[node] if self.tree.nodes[child]['node_type'] == child_type)
+        return self._arrays.children_with_type(node, child_type)
+
+    def _preorder_with_depth(self) -> Iterator[Tuple[int, int]]:
+        if self._arrays is not None:
+            arrays = self._arrays
+            for position, depth in arrays.preorder(arrays.position_by_index[self.root]):
+                yield arrays.node_indexes_list[position], depth
+            return
+
+        depth = 0
+        for _, destination, edge_type in dfs_labeled_edges(self.tree, self.root):
+            if edge_type == 'forward':
+                yield destination, depth
+                depth += 1
+            elif edge_type == 'reverse':
+                depth -= 1
+
+    def _get_subtrees_from_networkx(self, *root_type: ASTNodeType) -> Iterator['AST']:
+        is_inside_subtree = False
+        current_subtree_root = -1  # all node indexes are positive
+        subtree: List[int] = []
+        for _, destination, edge_type in dfs_labeled_edges(self.tree, self.root):
+            if edge_type == 'forward':
+                if is_inside_subtree:
+                    subtree.append(destination)
+                elif self.tree.nodes[destination]['node_type'] in root_type:
+                    subtree.append(destination)
+                    is_inside_subtree = True
+                    current_subtree_root = destination
+            elif edge_type == 'reverse' and destination == current_subtree_root:
+                is_inside_subtree = False
+                yield AST(self.tree.subgraph(subtree), current_subtree_root)
+                subtree = []
+                current_subtree_root = -1
 
     @staticmethod
-    def _add_javalang_children(tree: DiGraph, children: List[Any], parent_index: int,
-                               javalang_node_to_index_map: Dict[Node, int]) -> None:
-        for child in children:
-            if isinstance(child, list):
-                AST._add_javalang_children(tree, child, parent_index, javalang_node_to_index_map)
+    def _add_subtree_from_javalang_node(nodes: List[Tuple[int, Dict[str, Any]]], edges: List[Tuple[int, int]],
+                                        javalang_node: Union[Node, Set[Any], str],
+                                        javalang_node_to_index_map: Dict[Node, int]) -> int:
+        '''
+        Collects all nodes reachable from javalang_node in depth first preorder
+        as (node index, attributes) pairs into nodes and (parent, child) pairs into edges.
+        Node indexes start from 1 and follow the order of collected nodes.
+        Explicit stack of (parent index, javalang node or list of them) pairs is used
+        instead of recursion, so deep javalang trees neither hit recursion limit
+        nor pay for a python call per node.
+        '''
+        root_index = AST._UNKNOWN_NODE_TYPE
+        stack: List[Tuple[Optional[int], Any]] = [(None, javalang_node)]
+        while stack:
+            parent_index, current_node = stack.pop()
+            if isinstance(current_node, list):
+                stack.extend((parent_index, child) for child in reversed(current_node))
+                continue
+
+            node_index, node_type = AST._add_javalang_node(nodes, edges, current_node)
+            if node_index == AST._UNKNOWN_NODE_TYPE:
+                continue
+
+            if parent_index is None:
+                root_index = node_index
             else:
-                child_index = AST._add_subtree_from_javalang_node(tree, child, javalang_node_to_index_map)
-                if child_index != AST._UNKNOWN_NODE_TYPE:
-                    tree.add_edge(parent_index, child_index)
+                edges.append((parent_index, node_index))
+
+            if node_type not in AST._LEAF_NODE_TYPES:
+                javalang_standard_node = cast(Node, current_node)
+                javalang_node_to_index_map[javalang_standard_node] = node_index
+                stack.extend((node_index, child) for child in reversed(javalang_standard_node.children))
+
+        return root_index
 
     @staticmethod
-    def _add_javalang_node(tree: DiGraph, javalang_node: Union[Node, Set[Any], str]) -> Tuple[int, ASTNodeType]:
+    def _add_javalang_node(nodes: List[Tuple[int, Dict[str, Any]]], edges: List[Tuple[int, int]],
+                           javalang_node: Union[Node, Set[Any], str]) -> Tuple[int, ASTNodeType]:
         node_index = AST._UNKNOWN_NODE_TYPE
         node_type = ASTNodeType.UNKNOWN
         if isinstance(javalang_node, Node):
-            node_index, node_type = AST._add_javalang_standard_node(tree, javalang_node)
+            node_index, node_type = AST._add_javalang_standard_node(nodes, javalang_node)
         elif isinstance(javalang_node, set):
-            node_index = AST._add_javalang_collection_node(tree, javalang_node)
+            node_index = AST._add_javalang_collection_node(nodes, edges, javalang_node)
             node_type = ASTNodeType.COLLECTION
         elif isinstance(javalang_node, str):
-            node_index = AST._add_javalang_string_node(tree, javalang_node)
+            node_index = AST._add_javalang_string_node(nodes, javalang_node)
             node_type = ASTNodeType.STRING
 
         return node_index, node_type
 
     @staticmethod
-    def _add_javalang_standard_node(tree: DiGraph, javalang_node: Node) -> Tuple[int, ASTNodeType]:
-        node_index = len(tree) + 1
-        node_type = javalang_to_ast_node_type[type(javalang_node)]
-
-        attr_names = attributes_by_node_type[node_type]
+    def _add_javalang_standard_node(nodes: List[Tuple[int, Dict[str, Any]]],
+                                    javalang_node: Node) -> Tuple[int, ASTNodeType]:
+        node_index = len(nodes) + 1
+        node_type, attr_names = AST._javalang_node_descriptions[type(javalang_node)]
         attributes = {attr_name: getattr(javalang_node, attr_name) for attr_name in attr_names}
 
         attributes['node_type'] = node_type
         attributes['line'] = javalang_node.position.line if javalang_node.position is not None else None
 
-        AST._post_process_javalang_attributes(tree, node_type, attributes)
+        AST._post_process_javalang_attributes(node_type, attributes)
 
-        tree.add_node(node_index, **attributes)
+        nodes.append((node_index, attributes))
         return node_index, node_type
 
     @staticmethod
-    def _post_process_javalang_attributes(tree: DiGraph, node_type: ASTNodeType, attributes: Dict[str, Any]) -> None:
+    def _post_process_javalang_attributes(node_type: ASTNodeType, attributes: Dict[str, Any]) -> None:
         """
         Replace some attributes with more appropriate values for convenient work
         """
 
-        if node_type == ASTNodeType.METHOD_DECLARATION and attributes["body"] is None:
+        if node_type == _METHOD_DECLARATION and attributes["body"] is None:
             attributes["body"] = []
 
-        if node_type == ASTNodeType.LAMBDA_EXPRESSION and isinstance(attributes["body"], Node):
+        if node_type == _LAMBDA_EXPRESSION and isinstance(attributes["body"], Node):
             attributes["body"] = [attributes["body"]]
 
-        if node_type in {ASTNodeType.METHOD_INVOCATION, ASTNodeType.MEMBER_REFERENCE} and \
-                attributes["qualifier"] == "":
+        if node_type in AST._NODE_TYPES_WITH_QUALIFIER and attributes["qualifier"] == "":
             attributes["qualifier"] = None
 
     @staticmethod
-    def _add_javalang_collection_node(tree: DiGraph, collection_node: Set[Any]) -> int:
-        node_index = len(tree) + 1
-        tree.add_node(node_index, node_type=ASTNodeType.COLLECTION, line=None)
+    def _add_javalang_collection_node(nodes: List[Tuple[int, Dict[str, Any]]], edges: List[Tuple[int, int]],
+                                      collection_node: Set[Any]) -> int:
+        node_index = len(nodes) + 1
+        nodes.append((node_index, {'node_type': ASTNodeType.COLLECTION, 'line': None}))
         # we expect only strings in collection
         # we add them here as children
         for item in collection_node:
             if type(item) == str:
-                string_node_index = AST._add_javalang_string_node(tree, item)
-                tree.add_edge(node_index, string_node_index)
+                string_node_index = AST._add_javalang_string_node(nodes, item)
+                edges.append((node_index, string_node_index))
             elif item is not None:
                 raise ValueError('Unexpected javalang AST node type {} inside \
                                  "COLLECTION" node'.format(type(item)))
         return node_index
 
     @staticmethod
-    def _add_javalang_string_node(tree: DiGraph, string_node: str) -> int:
-        node_index = len(tree) + 1
-        tree.add_node(node_index, node_type=ASTNodeType.STRING, string=string_node, line=None)
+    def _add_javalang_string_node(nodes: List[Tuple[int, Dict[str, Any]]], string_node: str) -> int:
+        node_index = len(nodes) + 1
+        nodes.append((node_index, {'node_type': ASTNodeType.STRING, 'string': string_node, 'line': None}))
         return node_index
 
     @staticmethod
@@ -335,18 +427,16 @@ class AST:
          - just javalang Node
          - list of javalang Nodes and other such lists (with any depth)
         '''
-        for node, attributes in tree.nodes.items():
-            for attribute_name in attributes:
-                attribute_value = attributes[attribute_name]
+        for attributes in tree.nodes.values():
+            # attributes dict is updated in place, instead of merging it through
+            # 'tree.add_node' for every replaced attribute
+            for attribute_name, attribute_value in attributes.items():
                 if isinstance(attribute_value, Node):
-                    node_reference = AST._create_reference_to_node(attribute_value,
-                                                                   javalang_node_to_index_map)
-                    tree.add_node(node, **{attribute_name: node_reference})
+                    attributes[attribute_name] = \
+                        AST._create_reference_to_node(attribute_value, javalang_node_to_index_map)
                 elif isinstance(attribute_value, list):
-                    node_references = \
-                        AST._replace_javalang_nodes_in_list(attribute_value,
-                                                            javalang_node_to_index_map)
-                    tree.add_node(node, **{attribute_name: node_references})
+                    attributes[attribute_name] = \
+                        AST._replace_javalang_nodes_in_list(attribute_value, javalang_node_to_index_map)
 
     @staticmethod
     def _replace_javalang_nodes_in_list(javalang_nodes_list: List[Any],
@@ -379,3 +469,14 @@ class AST:
         return ASTNodeReference(javalang_node_to_index_map[javalang_node])
 
     _UNKNOWN_NODE_TYPE = -1
+
+    # type of ast node and names of its attributes for each javalang node class,
+    # so a single lookup per javalang node is enough
+    _javalang_node_descriptions: Dict[Type[Node], Tuple[ASTNodeType, Tuple[str, ...]]] = {
+        javalang_type: (node_type, tuple(attributes_by_node_type[node_type]))
+        for javalang_type, node_type in javalang_to_ast_node_type.items()
+    }
+
+    _LEAF_NODE_TYPES = frozenset((ASTNodeType.COLLECTION, ASTNodeType.STRING))
+
+    _NODE_TYPES_WITH_QUALIFIER = frozenset((ASTNodeType.METHOD_INVOCATION, ASTNodeType.MEMBER_REFERENCE))
@@ -22,8 +22,12 @@
 
 from typing import Any, List, Iterator, Optional
 
+try:
+    from functools import cached_property
+except ImportError:  # python 3.7
+    from cached_property import cached_property  # type: ignore
+
 from networkx import DiGraph, dfs_preorder_nodes  # type: ignore
-from cached_property import cached_property  # type: ignore
 
 from aibolit.ast_framework._auxiliary_data import (
     common_attributes,
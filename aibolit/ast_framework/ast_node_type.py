@@ -20,10 +20,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from enum import Enum, auto
+from enum import IntEnum, auto
 
 
-class ASTNodeType(Enum):
+class ASTNodeType(IntEnum):
     ANNOTATION = auto()
     ANNOTATION_DECLARATION = auto()
     ANNOTATION_METHOD = auto()
@@ -107,3 +107,7 @@ class ASTNodeType(Enum):
 
     def __str__(self) -> str:
         return self.name.replace('_', ' ').capitalize()
+
+    def __format__(self, format_spec: str) -> str:
+        # IntEnum formats members as integers on older Python versions
+        return format(str(self), format_spec)
@@ -21,7 +21,10 @@
 # SOFTWARE.
 
 
-from cached_property import cached_property  # type: ignore
+try:
+    from functools import cached_property
+except ImportError:  # python 3.7
+    from cached_property import cached_property  # type: ignore
 from deprecated import deprecated  # type: ignore
 
 from typing import Dict, Set, TYPE_CHECKING
@@ -38,8 +41,7 @@ if TYPE_CHECKING:
 @deprecated("This functionality must be transmitted to ASTNode")
 class JavaClass(AST):
     def __init__(self, tree: DiGraph, root: int, java_package: 'JavaPackage'):
-        self.tree = tree
-        self.root = root
+        super().__init__(tree, root)
         self._java_package = java_package
 
     @cached_property
@@ -20,7 +20,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from cached_property import cached_property  # type: ignore
+try:
+    from functools import cached_property
+except ImportError:  # python 3.7
+    from cached_property import cached_property  # type: ignore
 from typing import Dict, Set, TYPE_CHECKING
 from networkx import DiGraph, dfs_tree  # type: ignore
 from deprecated import deprecated  # type: ignore
@@ -36,8 +39,7 @@ if TYPE_CHECKING:
 @deprecated("This functionality must be transmitted to ASTNode")
 class JavaClassMethod(AST):
     def __init__(self, tree: DiGraph, root: int, java_class: 'JavaClass'):
-        self.tree = tree
-        self.root = root
+        super().__init__(tree, root)
         self._java_class = java_class
 
     @cached_property
@@ -20,7 +20,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from cached_property import cached_property  # type: ignore
+try:
+    from functools import cached_property
+except ImportError:  # python 3.7
+    from cached_property import cached_property  # type: ignore
 from deprecated import deprecated  # type: ignore
 
 from typing import Dict
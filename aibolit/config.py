@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from aibolit.ast_framework import ASTNodeType
@@ -89,7 +90,9 @@ class Config(metaclass=Singleton):
         return os.environ.get('HOME_TEST_DATASET')
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_patterns_config():
+        # the same config is returned on every call, so it must not be modified
         return {
             "patterns": [
                 {"name": "Asserts", "code": "P1", "make": lambda: P1()},
@@ -176,10 +179,11 @@ class Config(metaclass=Singleton):
             "target": {
 
             },
-            "patterns_exclude": [
+            # excluded codes are only checked for membership, so they are kept in sets
+            "patterns_exclude": frozenset([
                 "P27",  # empty implementation
                 "P20_5", "P20_7", "P20_11",  # wasn't refactored yet
                 "P28", "P9",  # patterns based on text cannot accept arbitrary AST
-            ],
-            "metrics_exclude": ["M1", "M3_1", "M3_2", "M3_3", "M3_4", "M5", "M7", "M8"]
+            ]),
+            "metrics_exclude": frozenset(["M1", "M3_1", "M3_2", "M3_3", "M3_4", "M5", "M7", "M8"])
         }
@@ -2,10 +2,8 @@ import os
 import shutil
 import subprocess
 from pathlib import Path
-import pickle
-from aibolit.model.model import PatternRankingModel, scale_dataset  # type: ignore
 from aibolit.config import Config
-import pandas as pd  # type: ignore
+from aibolit.utils.model_io import dump_model, load_model
 
 
 def collect_dataset(args):
@@ -15,29 +13,26 @@ def collect_dataset(args):
 
     def make_patterns(args, cur_work_dir):
         print('Compute patterns...')
-        result = subprocess.run(['make', 'patterns'], stdout=subprocess.PIPE, encoding='utf-8', cwd=cur_work_dir)
-        print(result.returncode)
-        if result.returncode != 0:
-            print(result.stderr)
-            exit(3)
+        run_cmd(['make', 'patterns'], cur_work_dir, error_code=3)
+        if args.dataset_file:
+            dataset_file_path = Path(cur_work_dir, args.dataset_file)
+            if not dataset_file_path.parent.exists():
+                dataset_file_path.parent.mkdir(parents=True)
+            shutil.copy(Path(Config.dataset_file()), dataset_file_path)
         else:
-            print(result.stdout)
-            if args.dataset_file:
-                dataset_file_path = Path(cur_work_dir, args.dataset_file)
-                if not dataset_file_path.parent.exists():
-                    dataset_file_path.parent.mkdir(parents=True)
-                shutil.copy(Path(Config.dataset_file()), dataset_file_path)
-            else:
-                dataset_file_path = Path(Config.dataset_file())
-            print('dataset was saved to {}'.format(str(dataset_file_path.absolute())))
-
-    def run_cmd(metrics_cmd, cur_work_dir):
-        result = subprocess.run(metrics_cmd, stdout=subprocess.PIPE, encoding='utf-8', cwd=cur_work_dir)
-        if result.returncode != 0:
-            print(result.stderr)
-            exit(1)
-        else:
-            print(result.stdout)
+            dataset_file_path = Path(Config.dataset_file())
+        print('dataset was saved to {}'.format(str(dataset_file_path.absolute())))
+
+    def run_cmd(metrics_cmd, cur_work_dir, error_code=1):
+        # output is printed line by line as soon as it is produced instead of
+        # being collected in memory until the command finishes,
+        # stderr is not captured and goes directly to the console
+        with subprocess.Popen(metrics_cmd, stdout=subprocess.PIPE, bufsize=1,
+                              encoding='utf-8', cwd=cur_work_dir) as process:
+            for line in process.stdout:
+                print(line, end='')
+        if process.returncode != 0:
+            exit(error_code)
 
     # path to java files which will be analyzed
     java_folder = args.java_folder
@@ -74,13 +69,18 @@ def train_process(target_metric_code="M4"):
     """
     Define needed columns for dataset and run model training
     """
+    # model and dataframe libraries are heavy to import,
+    # so they are loaded only when training is actually requested
+    import pandas as pd  # type: ignore
+    from aibolit.model.model import PatternRankingModel, scale_dataset  # type: ignore
+
     config = Config.get_patterns_config()
     only_patterns = [
-        x['code'] for x in list(config['patterns'])
+        x['code'] for x in config['patterns']
         if x['code'] not in config['patterns_exclude']
     ]
     only_metrics = \
-        [x['code'] for x in list(config['metrics'])
+        [x['code'] for x in config['metrics']
          if x['code'] not in config['metrics_exclude']] \
         + ['halstead volume']
     columns_features = only_metrics + only_patterns
@@ -105,26 +105,24 @@ def train_process(target_metric_code="M4"):
 
     save_model_file = Path(Config.folder_to_save_model_data(), 'model.pkl')
     print('Saving model to loaded model from file {}:'.format(save_model_file))
-    with open(save_model_file, 'wb') as fid:
-        pickle.dump(model, fid)
+    dump_model(model, save_model_file)
 
     load_model_file = Path(Config.folder_to_save_model_data(), 'model.pkl')
     print('Test loaded model from file {}:'.format(load_model_file))
     test_dataset = pd.read_csv(Config.test_csv(), index_col=None)
-    with open(load_model_file, 'rb') as fid:
-        model_new = pickle.load(fid)
-        scaled_test_dataset = scale_dataset(
-            test_dataset,
-            model_new.features_conf,
-            target_metric_code
-        ).sample(n=10, random_state=17)
-        print('Model has been loaded successfully')
-        # add ncss, ncss is needed in informative as a  last column
-        X_test = scaled_test_dataset[only_patterns + ['M2']]
-
-        for _, row in X_test.iterrows():
-            preds, importances = model_new.rank(row.values)
-            print(preds)
+    model_new = load_model(load_model_file)
+    scaled_test_dataset = scale_dataset(
+        test_dataset,
+        model_new.features_conf,
+        target_metric_code
+    ).sample(n=10, random_state=17)
+    print('Model has been loaded successfully')
+    # add ncss, ncss is needed in informative as a  last column
+    X_test = scaled_test_dataset[only_patterns + ['M2']]
+
+    for _, row in X_test.iterrows():
+        preds, importances = model_new.rank(row.values)
+        print(preds)
     path_with_logs = Path(os.getcwd(), 'catboost_info')
     print('Removing path with catboost logs {}'.format(path_with_logs))
     if path_with_logs.exists():
@@ -53,7 +53,7 @@ def scale_dataset(
     config = Config.get_patterns_config()
     patterns_codes_set = set([x['code'] for x in config['patterns']])
     metrics_codes_set = [x['code'] for x in config['metrics']]
-    exclude_features = set(config['patterns_exclude']).union(set(config['metrics_exclude']))
+    exclude_features = config['patterns_exclude'] | config['metrics_exclude']
     used_codes = set(features_conf['features_order'])
     used_codes.add(target_metric_code)
     not_scaled_codes = set(patterns_codes_set).union(set(metrics_codes_set)).difference(used_codes).difference(
@@ -1,9 +1,9 @@
-import pickle
 from typing import Dict, Any, Tuple
 
 import numpy as np
 import pandas as pd
 from aibolit.config import Config
+from aibolit.utils.model_io import load_model
 from aibolit.model.model import PatternRankingModel, scale_dataset, get_minimum  # noqa: F401 type: ignore
 
 
@@ -14,9 +14,8 @@ class Stats(object):
         if not model:
             load_model_file = Config.folder_model_data()
             print('Loading model from file {}:'.format(load_model_file))
-            with open(load_model_file, 'rb') as fid:
-                model = pickle.load(fid)
-                print('Model has been loaded successfully')
+            model = load_model(load_model_file)
+            print('Model has been loaded successfully')
 
         scaled_dataset = scale_dataset(test_csv, model.features_conf, "M4")
         cleaned_dataset = scaled_dataset[model.features_conf['features_order'] + ['M2']]
@@ -33,17 +32,13 @@ class Stats(object):
             acts: np.array,
             ranked: np.array) -> Tuple[np.array, np.array]:
         patterns_numbers = ranked[:, 0]
+        patterns_count = ranked.shape[1]
         # number of times when pattern was on first place,
         # if we decrease pattern by 1/ncss
-        m = np.zeros(ranked.shape[1])
+        m = np.bincount(patterns_numbers[acts == 1], minlength=patterns_count).astype(float)
         # number of times when pattern was on first place,
         # if we increase pattern by 1/ncss
-        p = np.zeros(ranked.shape[1])
-        for i in range(len(patterns_numbers)):
-            if acts[i] == 1:
-                m[patterns_numbers[i]] += 1
-            elif acts[i] == 2:
-                p[patterns_numbers[i]] += 1
+        p = np.bincount(patterns_numbers[acts == 2], minlength=patterns_count).astype(float)
         return m, p
 
     @staticmethod
@@ -117,15 +112,9 @@ class Stats(object):
         1st is dataset with pattern where pattern can be null,
         2nd is dataset with pattern where pattern is not null,
         """
-        nulls = []
-        not_nulls = []
-        for snipp in X:
-            if snipp[pattern_idx] == 0:
-                nulls.append(snipp)
-            else:
-                not_nulls.append(snipp)
-
-        return np.array(nulls), np.array(not_nulls)
+        X = np.asarray(X)
+        is_null = X[:, pattern_idx] == 0
+        return X[is_null], X[~is_null]
 
     @staticmethod
     def change_matrix_by_value(
@@ -1,8 +1,30 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Union
+
 from javalang.parse import parse
 from javalang.tree import CompilationUnit
 
+from aibolit.ast_framework import AST
 from aibolit.utils.encoding_detector import read_text_with_autodetected_encoding
 
 
 def build_ast(filename: str) -> CompilationUnit:
     return parse(read_text_with_autodetected_encoding(filename))
+
+
+def build_cached_ast(filename: Union[str, Path]) -> AST:
+    '''
+    Builds AST for the file, reusing the tree built earlier for the same file.
+    The file is rebuilt if it was modified since then.
+    Returned AST is shared between callers, so it must not be modified.
+    Cached trees are kept alive, so it is meant for tests, which build the same files many times,
+    rather than for processing of many files, each of which is analyzed once.
+    '''
+    file_path = Path(filename).resolve()
+    return _build_ast_for_file_version(str(file_path), file_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _build_ast_for_file_version(filename: str, modification_time: int) -> AST:
+    return AST.build_from_javalang(build_ast(filename))
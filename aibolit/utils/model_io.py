@@ -0,0 +1,59 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2020 Aibolit
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pickle
+from pathlib import Path
+from typing import Any, Union
+
+# models are large binary blobs, so they are read and written with big chunks
+_MODEL_FILE_BUFFER_SIZE = 1024 * 1024
+
+_ZSTD_COMPRESSION_LEVEL = 3
+
+# models saved before compression was introduced are plain pickle files,
+# they are told apart by the magic number starting every zstd frame
+_ZSTD_MAGIC_NUMBER = b'\x28\xb5\x2f\xfd'
+
+
+def dump_model(model: Any, filename: Union[str, Path]) -> None:
+    # zstandard is imported only when a model is actually saved or loaded,
+    # so it does not slow down start of modules, which just refer to these functions
+    import zstandard  # type: ignore
+
+    compressor = zstandard.ZstdCompressor(level=_ZSTD_COMPRESSION_LEVEL)
+    with open(filename, 'wb', buffering=_MODEL_FILE_BUFFER_SIZE) as model_file:
+        with compressor.stream_writer(model_file, closefd=False) as compressed_file:
+            pickle.dump(model, compressed_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_model(filename: Union[str, Path]) -> Any:
+    with open(filename, 'rb', buffering=_MODEL_FILE_BUFFER_SIZE) as model_file:
+        is_compressed = model_file.read(len(_ZSTD_MAGIC_NUMBER)) == _ZSTD_MAGIC_NUMBER
+        model_file.seek(0)
+        if not is_compressed:
+            return pickle.load(model_file)
+
+        import zstandard  # type: ignore
+
+        # model is unpickled right from the stream, without keeping whole decompressed data in memory
+        with zstandard.ZstdDecompressor().stream_reader(model_file, closefd=False) as decompressed_file:
+            return pickle.load(decompressed_file)
@@ -45,6 +45,29 @@ class ASTTestSuite(TestCase):
                 self.assertEqual([node.node_index for node in actual_subtree],
                                  expected_subtree)
 
+    def test_queries_without_arrays_index(self):
+        ast = self._build_ast("SimpleClass.java")
+        plain_ast = AST(ast.tree, ast.root)
+        self.assertEqual(str(plain_ast), str(ast))
+        self.assertEqual(list(plain_ast.get_nodes(ASTNodeType.STRING)),
+                         list(ast.get_nodes(ASTNodeType.STRING)))
+        for plain_subtree, subtree in zip_longest(plain_ast.get_subtrees(ASTNodeType.METHOD_DECLARATION),
+                                                  ast.get_subtrees(ASTNodeType.METHOD_DECLARATION)):
+            with self.subTest():
+                self.assertEqual(str(plain_subtree), str(subtree))
+                self.assertEqual(plain_subtree.list_all_children_with_type(plain_subtree.root, ASTNodeType.STRING),
+                                 subtree.list_all_children_with_type(subtree.root, ASTNodeType.STRING))
+
+    def test_nodes_with_types_selection(self):
+        ast = self._build_ast("MethodUseOtherMethodExample.java")
+        plain_ast = AST(ast.tree, ast.root)
+        for types in [(ASTNodeType.METHOD_DECLARATION,),
+                      (ASTNodeType.STRING, ASTNodeType.METHOD_INVOCATION),
+                      (ASTNodeType.CLASS_DECLARATION, ASTNodeType.CLASS_DECLARATION)]:
+            with self.subTest(types=types):
+                self.assertEqual([node.node_index for node in ast.get_proxy_nodes(*types)],
+                                 [node.node_index for node in plain_ast.get_proxy_nodes(*types)])
+
     def test_complex_fields(self):
         ast = self._build_ast('StaticConstructor.java')
         class_declaration = next((declaration for declaration in ast.get_root().types if
@@ -26,7 +26,7 @@ from pathlib import Path
 from aibolit.__main__ import flatten
 from aibolit.ast_framework import AST, ASTNodeType
 from aibolit.ast_framework.java_class_decomposition import decompose_java_class
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_ast, build_cached_ast
 
 
 class JavaClassDecompositionTestSuite(TestCase):
@@ -66,7 +66,7 @@ class JavaClassDecompositionTestSuite(TestCase):
 
     def __decompose_with_setter_functionality(self, ignore_getters=False, ignore_setters=False):
         file = str(Path(self.cur_dir, 'LottieImageAsset.java'))
-        ast = AST.build_from_javalang(build_ast(file))
+        ast = build_cached_ast(file)
         classes_ast = [
             ast.get_subtree(node)
             for node in ast.get_root().types
@@ -26,7 +26,7 @@ from typing import List, Iterator
 
 from aibolit.ast_framework import AST, ASTNodeType
 from aibolit.ast_framework.scope import Scope
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_cached_ast
 
 StatementsTypes = List[ASTNodeType]
 
@@ -103,7 +103,7 @@ class ScopeTestCase(TestCase):
 
     def _get_method_ast(self, method_name) -> AST:
         path = str(Path(__file__).absolute().parent / "ScopeTest.java")
-        ast = AST.build_from_javalang(build_ast(path))
+        ast = build_cached_ast(path)
         package_declaration = ast.get_root()
 
         assert len(package_declaration.types) == 1 and \
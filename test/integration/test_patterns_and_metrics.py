@@ -28,8 +28,7 @@ import numpy as np
 from tqdm import tqdm
 
 from aibolit.config import Config
-from aibolit.ast_framework import AST
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_cached_ast
 
 # TODO: fix all errors in the patterns/metrics and make these lists empty
 EXCLUDE_PATTERNS: Set[str] = {}
@@ -53,7 +52,7 @@ def _check_pattern(pattern_info, filepath):
         if pattern_info["code"] in PATTERNS_ACCEPT_FILE_PATH:
             pattern_result = pattern.value(filepath)
         else:
-            ast = AST.build_from_javalang(build_ast(filepath))
+            ast = build_cached_ast(filepath)
             pattern_result = pattern.value(ast)
 
         assert isinstance(pattern_result, list) and all(
@@ -72,7 +71,7 @@ def _check_metric(metric_info, filepath):
         if metric_info["code"] in METRICS_ACCEPT_FILE_PATH:
             metric_result = metric.value(filepath)
         else:
-            ast = AST.build_from_javalang(build_ast(filepath))
+            ast = build_cached_ast(filepath)
             metric_result = metric.value(ast)
 
         assert isinstance(metric_result, (int, float, np.float64)), (
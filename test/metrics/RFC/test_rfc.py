@@ -25,7 +25,7 @@ from pathlib import Path
 
 from aibolit.metrics.RFC.rfc import RFC
 from aibolit.ast_framework import AST
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_cached_ast
 
 
 class RFCTestSuite(TestCase):
@@ -82,4 +82,4 @@ class RFCTestSuite(TestCase):
     @staticmethod
     def _get_ast(filename: str) -> AST:
         path = Path(__file__).absolute().parent / filename
-        return AST.build_from_javalang(build_ast(str(path)))
+        return build_cached_ast(str(path))
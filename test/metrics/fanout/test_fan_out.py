@@ -26,7 +26,7 @@ from unittest import TestCase
 
 from aibolit.metrics.fanout.FanOut import FanOut
 from aibolit.ast_framework import AST
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_cached_ast
 
 
 class FanOutTestSuite(TestCase):
@@ -68,4 +68,4 @@ class FanOutTestSuite(TestCase):
     @staticmethod
     def _build_ast(filename: str) -> AST:
         path = Path(__file__).absolute().parent / filename
-        return AST.build_from_javalang(build_ast(str(path)))
+        return build_cached_ast(str(path))
@@ -25,8 +25,7 @@ from pathlib import Path
 from unittest import TestCase
 
 from aibolit.patterns.assert_in_code.assert_in_code import AssertInCode
-from aibolit.ast_framework import AST
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_cached_ast
 
 
 class AssertInCodeTestCase(TestCase):
@@ -34,5 +33,5 @@ class AssertInCodeTestCase(TestCase):
 
     def test_assert_in_code(self):
         file = Path(self.cur_file_dir, "Book.java")
-        ast = AST.build_from_javalang(build_ast(file))
+        ast = build_cached_ast(file)
         self.assertEqual(AssertInCode().value(ast), [3])
@@ -24,8 +24,7 @@ from pathlib import Path
 from unittest import TestCase
 
 from aibolit.patterns.classic_setter.classic_setter import ClassicSetter
-from aibolit.ast_framework import AST
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_cached_ast
 
 
 class SetterTestCase(TestCase):
@@ -33,14 +32,14 @@ class SetterTestCase(TestCase):
 
     def test_one_valid_patterns(self):
         filepath = self.current_directory / "BaseKeyframeAnimation.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = ClassicSetter()
         lines = pattern.value(ast)
         self.assertEqual(lines, [40])
 
     def test_four_setter_patterns(self):
         filepath = self.current_directory / "Configuration.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = ClassicSetter()
         lines = pattern.value(ast)
         self.assertEqual(lines,
@@ -50,7 +49,7 @@ class SetterTestCase(TestCase):
 
     def test_another_setter_patterns(self):
         filepath = self.current_directory / "SequenceFile.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = ClassicSetter()
         lines = pattern.value(ast)
         self.assertEqual(lines, [259, 744, 2849, 2855, 2861, 3127])
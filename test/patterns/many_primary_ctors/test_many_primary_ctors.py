@@ -24,8 +24,7 @@ from pathlib import Path
 from unittest import TestCase
 
 from aibolit.patterns.many_primary_ctors.many_primary_ctors import ManyPrimaryCtors
-from aibolit.ast_framework import AST
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_cached_ast
 
 
 class ManyPrimaryCtorsTestCase(TestCase):
@@ -33,7 +32,7 @@ class ManyPrimaryCtorsTestCase(TestCase):
 
     def test_many_primary_ctors(self):
         filepath = self.current_directory / "Book.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = ManyPrimaryCtors()
         lines = pattern.value(ast)
         self.assertEqual(lines, [4, 8])
@@ -24,8 +24,7 @@ from pathlib import Path
 import unittest
 
 from aibolit.patterns.method_siblings.method_siblings import MethodSiblings
-from aibolit.ast_framework import AST
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_cached_ast
 
 
 class MethodSiblingsTestCase(unittest.TestCase):
@@ -33,14 +32,14 @@ class MethodSiblingsTestCase(unittest.TestCase):
 
     def test_find_simple_method_siblings(self):
         filepath = self.current_directory / "SimpleMethodSiblings.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = MethodSiblings()
         lines = pattern.value(ast)
         self.assertEqual(lines, [2, 5])
 
     def test_find_alternate_method_siblings(self):
         filepath = self.current_directory / "AlternateMethodSiblings.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = MethodSiblings()
         lines = pattern.value(ast)
         self.assertEqual(lines, [2, 8])
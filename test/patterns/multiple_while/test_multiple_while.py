@@ -24,8 +24,7 @@ from pathlib import Path
 from unittest import TestCase
 
 from aibolit.patterns.multiple_while.multiple_while import MultipleWhile
-from aibolit.ast_framework import AST
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_cached_ast
 
 
 class MultipleWhilePatternTestCase(TestCase):
@@ -33,28 +32,28 @@ class MultipleWhilePatternTestCase(TestCase):
 
     def test_simple(self):
         filepath = self.current_directory / "Simple.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = MultipleWhile()
         lines = pattern.value(ast)
         self.assertEqual(lines, [2])
 
     def test_one_while(self):
         filepath = self.current_directory / "OneWhile.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = MultipleWhile()
         lines = pattern.value(ast)
         self.assertEqual(lines, [])
 
     def test_if_while(self):
         filepath = self.current_directory / "IfWhile.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = MultipleWhile()
         lines = pattern.value(ast)
         self.assertEqual(lines, [2])
 
     def test_multiple_while(self):
         filepath = self.current_directory / "MultipleWhile.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = MultipleWhile()
         lines = pattern.value(ast)
         self.assertEqual(lines, [])
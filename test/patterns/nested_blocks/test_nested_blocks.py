@@ -24,8 +24,8 @@ from pathlib import Path
 from unittest import TestCase
 
 from aibolit.patterns.nested_blocks.nested_blocks import NestedBlocks
-from aibolit.ast_framework import AST, ASTNodeType
-from aibolit.utils.ast_builder import build_ast
+from aibolit.ast_framework import ASTNodeType
+from aibolit.utils.ast_builder import build_cached_ast
 
 
 class NestedBlocksTestCase(TestCase):
@@ -33,49 +33,49 @@ class NestedBlocksTestCase(TestCase):
 
     def test_single_for_loop(self):
         filepath = self.current_directory / "SingleFor.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = NestedBlocks(2, ASTNodeType.FOR_STATEMENT)
         lines = pattern.value(ast)
         self.assertEqual(lines, [15, 19])
 
     def test_nested_for_loops(self):
         filepath = self.current_directory / "NestedFor.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = NestedBlocks(2, ASTNodeType.FOR_STATEMENT)
         lines = pattern.value(ast)
         self.assertEqual(lines, [22])
 
     def test_for_loops_in_different_methods(self):
         filepath = self.current_directory / "DifferentMethods.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = NestedBlocks(2, ASTNodeType.FOR_STATEMENT)
         lines = pattern.value(ast)
         self.assertEqual(lines, [28])
 
     def test_for_loops_in_nested_class(self):
         filepath = self.current_directory / "NestedForInNestedClasses.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = NestedBlocks(2, ASTNodeType.FOR_STATEMENT)
         lines = pattern.value(ast)
         self.assertEqual(lines, [9])
 
     def test_for_loops_in_anonymous_class(self):
         filepath = self.current_directory / "ForInAnonymousFile.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = NestedBlocks(2, ASTNodeType.FOR_STATEMENT)
         lines = pattern.value(ast)
         self.assertEqual(lines, [19])
 
     def test_nested_no_nested_if(self):
         filepath = self.current_directory / "NestedNoIF.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = NestedBlocks(2, ASTNodeType.IF_STATEMENT)
         lines = pattern.value(ast)
         self.assertEqual(lines, [])
 
     def test_nested_if(self):
         filepath = self.current_directory / "NestedIF.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = NestedBlocks(2, ASTNodeType.IF_STATEMENT)
         lines = pattern.value(ast)
         self.assertEqual(lines, [21, 42])
@@ -24,8 +24,7 @@ from pathlib import Path
 from unittest import TestCase
 
 from aibolit.patterns.non_final_attribute.non_final_attribute import NonFinalAttribute
-from aibolit.ast_framework import AST
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_cached_ast
 
 
 class NonFinalAttributeTestCase(TestCase):
@@ -33,21 +32,21 @@ class NonFinalAttributeTestCase(TestCase):
 
     def test_find_non_final_attributes(self):
         filepath = self.current_directory / "NonFinalAttribute.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = NonFinalAttribute()
         lines = pattern.value(ast)
         self.assertEqual(lines, [2, 4, 6, 8])
 
     def test_nested_class(self):
         filepath = self.current_directory / "File.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = NonFinalAttribute()
         lines = pattern.value(ast)
         self.assertEqual(lines, [12, 16, 64])
 
     def test_attribute_in_interface(self):
         filepath = self.current_directory / "AttributeInInterface.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = NonFinalAttribute()
         lines = pattern.value(ast)
         self.assertEqual(lines, [])
@@ -27,8 +27,7 @@ from typing import List
 from aibolit.patterns.partially_synchronized_methods.partially_synchronized_methods import (
     PartiallySynchronizedMethods,
 )
-from aibolit.ast_framework import AST
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_cached_ast
 
 
 class PartiallySynchronizedMethodsTestCase(TestCase):
@@ -49,6 +48,6 @@ class PartiallySynchronizedMethodsTestCase(TestCase):
 
     def _test_helper(self, filename: str, lines: List[int]):
         filepath = str(Path(__file__).absolute().parent / filename)
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = PartiallySynchronizedMethods()
         self.assertEqual(pattern.value(ast), lines)
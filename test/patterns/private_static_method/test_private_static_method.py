@@ -24,8 +24,7 @@ from pathlib import Path
 from unittest import TestCase
 
 from aibolit.patterns.private_static_method.private_static_method import PrivateStaticMethod
-from aibolit.ast_framework import AST
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_cached_ast
 
 
 class PrivateStaticMethodTestCase(TestCase):
@@ -33,7 +32,7 @@ class PrivateStaticMethodTestCase(TestCase):
 
     def test_find_private_static_methods(self):
         filepath = self.current_directory / "PrivateStaticMethod.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = PrivateStaticMethod()
         lines = pattern.value(ast)
         self.assertEqual(lines, [2])
@@ -24,8 +24,7 @@ from pathlib import Path
 from unittest import TestCase
 
 from aibolit.patterns.protected_method.protected_method import ProtectedMethod
-from aibolit.ast_framework import AST
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_cached_ast
 
 
 class ProtectedMethodTestCase(TestCase):
@@ -33,28 +32,28 @@ class ProtectedMethodTestCase(TestCase):
 
     def test_not_find_protected_method(self):
         filepath = self.current_directory / "NoProtectedMethod.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = ProtectedMethod()
         lines = pattern.value(ast)
         self.assertEqual(lines, [], "Should not match pattern protected method")
 
     def test_find_protected_method(self):
         filepath = self.current_directory / "ProtectedMethod.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = ProtectedMethod()
         lines = pattern.value(ast)
         self.assertEqual(lines, [2, 6], "Should match pattern protected method")
 
     def test_find_protected_method_inner(self):
         filepath = self.current_directory / "InnerClassProtectedMethod.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = ProtectedMethod()
         lines = pattern.value(ast)
         self.assertEqual(lines, [2, 11], "Should match pattern protected method in inner class")
 
     def test_find_protected_method_anonymous(self):
         filepath = self.current_directory / "AnonymousClassProtectedMethod.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = ProtectedMethod()
         lines = pattern.value(ast)
         self.assertEqual(lines, [5], "Should match pattern protected method in anonymous class")
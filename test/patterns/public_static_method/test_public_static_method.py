@@ -24,8 +24,7 @@ from pathlib import Path
 from unittest import TestCase
 
 from aibolit.patterns.public_static_method.public_static_method import PublicStaticMethod
-from aibolit.ast_framework import AST
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_cached_ast
 
 
 class PublicStaticMethodPatternTestCase(TestCase):
@@ -33,7 +32,7 @@ class PublicStaticMethodPatternTestCase(TestCase):
 
     def test_find_non_final_attributes(self):
         filepath = self.current_directory / "PublicStaticMethod.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = PublicStaticMethod()
         lines = pattern.value(ast)
         self.assertEqual(len(lines), 1)
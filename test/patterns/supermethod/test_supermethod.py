@@ -24,8 +24,7 @@ from pathlib import Path
 from unittest import TestCase
 
 from aibolit.patterns.supermethod.supermethod import SuperMethod
-from aibolit.ast_framework import AST
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_cached_ast
 
 
 class SuperMethodTestCase(TestCase):
@@ -33,7 +32,7 @@ class SuperMethodTestCase(TestCase):
 
     def test_empty(self):
         filepath = self.current_directory / "Empty.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = SuperMethod()
         lines = pattern.value(ast)
         self.assertEqual(len(lines), 0)
@@ -41,14 +40,14 @@ class SuperMethodTestCase(TestCase):
     def test_instance_of(self):
         # It has 2 matches in anonymous class!
         filepath = self.current_directory / "Anonymous.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = SuperMethod()
         lines = pattern.value(ast)
         self.assertEqual(len(lines), 1)
 
     def test_instance(self):
         filepath = self.current_directory / "Simple.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = SuperMethod()
         lines = pattern.value(ast)
         self.assertEqual(len(lines), 1)
@@ -56,28 +55,28 @@ class SuperMethodTestCase(TestCase):
     def test_several(self):
         # It has 2 matches in anonymous class!
         filepath = self.current_directory / "Several.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = SuperMethod()
         lines = pattern.value(ast)
         self.assertEqual(len(lines), 6)
 
     def test_nested_class(self):
         filepath = self.current_directory / "NestedClass.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = SuperMethod()
         lines = pattern.value(ast)
         self.assertEqual(len(lines), 1)
 
     def test_constructor(self):
         filepath = self.current_directory / "Constructor.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = SuperMethod()
         lines = pattern.value(ast)
         self.assertEqual(len(lines), 3)
 
     def test_complicated_constructor(self):
         filepath = self.current_directory / "ComplicatedChainConstructor.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = SuperMethod()
         lines = pattern.value(ast)
         self.assertEqual(len(lines), 0)
@@ -24,8 +24,7 @@ from pathlib import Path
 import unittest
 
 from aibolit.patterns.var_siblings.var_siblings import VarSiblings
-from aibolit.ast_framework import AST
-from aibolit.utils.ast_builder import build_ast
+from aibolit.utils.ast_builder import build_cached_ast
 
 
 class VarSiblingsTestCase(unittest.TestCase):
@@ -33,21 +32,21 @@ class VarSiblingsTestCase(unittest.TestCase):
 
     def test_find_simple_var_siblings(self):
         filepath = self.current_directory / "SimpleVarSiblings.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = VarSiblings()
         lines = pattern.value(ast)
         self.assertEqual(lines, [3, 4])
 
     def test_find_alternate_var_siblings(self):
         filepath = self.current_directory / "AlternateVarSiblings.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = VarSiblings()
         lines = pattern.value(ast)
         self.assertEqual(lines, [3, 5])
 
     def test_find_length_4_var_siblings(self):
         filepath = self.current_directory / "ShortVarSiblings.java"
-        ast = AST.build_from_javalang(build_ast(filepath))
+        ast = build_cached_ast(filepath)
         pattern = VarSiblings()
         lines = pattern.value(ast)
         self.assertEqual(lines, [9, 10])
@@ -97,7 +97,6 @@ class TestStats(TestCase):
         table = Stats.aibolit_stat(test_df, model)
         test_csv = Path(self.cur_file_dir, 'results_test.csv')
         results_df = pd.read_csv(test_csv, index_col=0)
-        all_elements_compared: pd.DataFrame = table.eq(results_df)
-        bool_eq_elems = np.ravel(all_elements_compared.values)
-        are_equal_arrays = np.logical_and.reduce(bool_eq_elems, axis=0)
-        self.assertTrue(are_equal_arrays)
+        self.assertTrue(table.columns.equals(results_df.columns))
+        self.assertTrue(table.index.equals(results_df.index))
+        self.assertTrue(np.array_equal(table.values, results_df.values))
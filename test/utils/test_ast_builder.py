@@ -0,0 +1,46 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2020 Aibolit
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import shutil
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from aibolit.utils.ast_builder import build_cached_ast
+
+
+class ASTBuilderTestCase(TestCase):
+    dir_path = Path(os.path.realpath(__file__)).parent
+
+    def test_cached_ast_is_reused(self):
+        filename = Path(self.dir_path, 'SimpleClass.java')
+        self.assertIs(build_cached_ast(filename), build_cached_ast(str(filename)))
+
+    def test_cached_ast_is_rebuilt_after_modification(self):
+        with TemporaryDirectory() as tmp_dir:
+            filename = Path(tmp_dir, 'SimpleClass.java')
+            shutil.copy(Path(self.dir_path, 'SimpleClass.java'), filename)
+            ast = build_cached_ast(filename)
+            modification_time = filename.stat().st_mtime_ns
+            os.utime(filename, ns=(modification_time + 10 ** 9, modification_time + 10 ** 9))
+            self.assertIsNot(build_cached_ast(filename), ast)
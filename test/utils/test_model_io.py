@@ -0,0 +1,46 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2020 Aibolit
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pickle
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from aibolit.utils.model_io import dump_model, load_model
+
+
+class ModelIOTestCase(TestCase):
+
+    def test_dumped_model_is_loaded(self):
+        model = {'features_order': ['P1', 'P2'], 'weights': [0.5, 0.25]}
+        with TemporaryDirectory() as tmp_dir:
+            filename = Path(tmp_dir, 'model.pkl')
+            dump_model(model, filename)
+            self.assertEqual(load_model(filename), model)
+
+    def test_uncompressed_model_is_loaded(self):
+        model = {'features_order': ['P1', 'P2'], 'weights': [0.5, 0.25]}
+        with TemporaryDirectory() as tmp_dir:
+            filename = Path(tmp_dir, 'model.pkl')
+            with open(filename, 'wb') as model_file:
+                pickle.dump(model, model_file)
+            self.assertEqual(load_model(filename), model)